@@ -87,4 +87,43 @@ class Config:
         Returns:
             bool: True if strict consistency is enabled (default), False otherwise
         """
-        return cls._config.get('elasticsearch_strict_consistency', True)
\ No newline at end of file
+        return cls._config.get('elasticsearch_strict_consistency', True)
+
+    @classmethod
+    def elasticsearch_max_connections(cls) -> int:
+        """Get the Elasticsearch connection pool size (connections per node).
+
+        Bounds how many requests can be in flight to each node at once. The client
+        default of 10 throttles concurrent request handling well below what ES serves.
+
+        Returns:
+            int: Configured pool size, default 100
+        """
+        return int(cls._config.get('elasticsearch_max_connections', 100))
+
+    @classmethod
+    def elasticsearch_write_buffer_ms(cls) -> int:
+        """Get the Elasticsearch single-write coalescing window in milliseconds.
+
+        When > 0, individual creates/updates are held for up to this long and sent
+        together in one _bulk request (or sooner, once a full chunk is waiting). Raises
+        write throughput under concurrent load at the cost of up to this much added
+        latency per write.
+
+        Returns:
+            int: Window in ms, default 0 (disabled - each write is its own request)
+        """
+        return int(cls._config.get('elasticsearch_write_buffer_ms', 0))
+
+    @classmethod
+    def elasticsearch_get_cache_seconds(cls) -> float:
+        """Get how long Elasticsearch get-by-id results are cached in-process.
+
+        When > 0, repeated gets of the same document within this window are served
+        without a request. Writes through this process invalidate the entry, but writes
+        from other processes are only seen once it expires.
+
+        Returns:
+            float: Cache lifetime in seconds, default 0 (disabled)
+        """
+        return float(cls._config.get('elasticsearch_get_cache_seconds', 0))
@@ -3,8 +3,9 @@ Document CRUD operations with explicit parameters.
 No dependency on RequestContext - can be used standalone.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple, TypeVar
 import warnings as python_warnings
 from pydantic import ValidationError as PydanticValidationError
 
@@ -16,12 +17,32 @@ from app.services.model import ModelService
 from app.services.request_context import RequestContext
 from app.config import Config
 
+# Documents of one create_many prepared (validated, fk/unique checked) at the same time.
+# Each preparation issues its own queries, so an unbounded gather over a large batch
+# would flood the database connection pool.
+PREPARE_CONCURRENCY = 8
+
+# Pages at least this large have their Pydantic validation run in a worker thread.
+# Validation is pure CPU; done inline for a big page it stalls every other request
+# on the event loop. Smaller pages validate faster than the thread hand-off costs.
+VALIDATE_OFFLOAD_MIN = 100
+
+T = TypeVar('T')
+
 class DocumentManager(ABC):
-    """Document CRUD operations with clean, focused interface"""
+    """Document CRUD operations with clean, focused interface
+
+    Write visibility: on search engines with near-real-time refresh (Elasticsearch),
+    a write is only visible to searches after the next index refresh. Drivers wait
+    for that refresh only when the caller must read its own write (e.g. unique
+    constraint checks); background and bulk writes skip it for throughput.
+    """
 
     def __init__(self, database):
         """Initialize with database interface reference for cleaner access patterns"""
         self.database = database
+        # (purpose, entity) -> value derived from the entity's field metadata
+        self._field_metadata_cache: Dict[Tuple[str, str], Any] = {}
     
     async def get_all(
         self,
@@ -57,9 +78,18 @@ class DocumentManager(ABC):
                 metadata = MetadataService.get(entity)
                 unique_constraints = metadata.get('uniques', []) if metadata else []
 
+                prevalidated = len(docs) >= VALIDATE_OFFLOAD_MIN
+                if prevalidated:
+                    docs = [self._reshape_document(entity, doc) for doc in docs]
+                    page_errors = await asyncio.to_thread(validate_models, model_class, docs)
+                    # Notification state is shared by all requests: report only from the event loop
+                    for doc, errors in zip(docs, page_errors):
+                        if errors:
+                            notify_model_errors(entity, doc, errors)
+
                 # Process each document
                 for i in range(len(docs)):
-                    docs[i] = await self._normalize_document(entity, docs[i], model_class, view_spec, unique_constraints, validate)
+                    docs[i] = await self._normalize_document(entity, docs[i], model_class, view_spec, unique_constraints, validate, prevalidated)
 
             return docs, count
         except Exception as e:
@@ -121,19 +151,81 @@ class DocumentManager(ABC):
                 return {}, 0, e
             raise  # Unreachable
 
-    async def _normalize_document(self, entity: str, doc: Dict[str, Any], model_class: Any, view_spec: Dict[str, Any], 
-                                  unique_constraints : List[Any], validate: bool) -> Dict[str, Any]:
-        """Normalize document by extracting internal id field and renaming to 'id'"""
+    async def get_many(
+        self,
+        entity: str,
+        ids: List[str],
+        view_spec: Dict[str, Any] = {}
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get several documents by ID in one database round trip.
+
+        Documents are returned in the order of ids, each once even if its id repeats.
+        IDs that don't exist are reported as NOT_FOUND warnings and left out of the result.
+
+        Returns:
+            Tuple of (documents, count)
+        """
+        # Each found dict is normalized in place, so it must be handed out only once
+        ids = list(dict.fromkeys(ids))
         try:
-            # make sure the id is in the right plae
-            core = self._get_core_manager()
-            id = doc.pop(core.id_field, None)
-            the_doc: Dict[str, Any] = {'id': id, **doc} # ensure id is first field
+            found = await self._get_many_impl(ids, entity)
+        except Exception as e:
+            Notification.error(HTTP.INTERNAL_ERROR, f"Database get error: {str(e)}")
+            raise  # Unreachable
+
+        model_class = ModelService.get_model_class(entity)
+        validate = Config.validation(True)
+        metadata = MetadataService.get(entity)
+        unique_constraints = metadata.get('uniques', []) if metadata else []
+
+        docs = []
+        for id in ids:
+            doc = found.get(id)
+            if not doc:
+                Notification.warning(Warning.NOT_FOUND, message="Document not found", entity=entity, entity_id=id)
+                continue
+            docs.append(await self._normalize_document(entity, doc, model_class, view_spec, unique_constraints, validate))
+        return docs, len(docs)
 
-            the_doc = self._remove_sub_objects(entity, the_doc)    # should not be there anyway
+    @abstractmethod
+    async def _get_many_impl(self, ids: List[str], entity: str) -> Dict[str, Dict[str, Any]]:
+        """Database-specific multi-get; returns found documents keyed by id"""
+        pass
+
+    def _reshape_document(self, entity: str, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Move the driver's internal id field to a leading 'id' and drop sub-objects"""
+        # make sure the id is in the right plae
+        core = self._get_core_manager()
+        id = doc.pop(core.id_field, None)
+
+        # Build the result in one pass: id first, then every field that is not a sub-object
+        # (should not be there anyway)
+        sub_objects = self._sub_object_names(entity)
+        if not sub_objects:
+            return {'id': id, **doc}
+        the_doc: Dict[str, Any] = {'id': id}
+        for field, value in doc.items():
+            if field.lower() not in sub_objects:
+                the_doc[field] = value
+        return the_doc
+
+    async def _normalize_document(self, entity: str, doc: Dict[str, Any], model_class: Any, view_spec: Dict[str, Any], 
+                                  unique_constraints : List[Any], validate: bool, prevalidated: bool = False) -> Dict[str, Any]:
+        """Normalize document by extracting internal id field and renaming to 'id'
+
+        prevalidated: doc was already reshaped and model-validated (see validate_models)
+        """
+        id = doc.get('id') if prevalidated else None
+        try:
+            if prevalidated:
+                the_doc = doc
+            else:
+                the_doc = self._reshape_document(entity, doc)
+                id = the_doc['id']
 
-            # Always run Pydantic validation (required fields, types, ranges)
-            validate_model(model_class, the_doc, entity)
+                # Always run Pydantic validation (required fields, types, ranges)
+                validate_model(model_class, the_doc, entity)
 
             if validate:
                 await validate_uniques(entity, the_doc, unique_constraints, None)
@@ -164,22 +256,27 @@ class DocumentManager(ABC):
         """Database-specific implementation of get"""
         pass
     
-    async def _save_document(
+    @abstractmethod
+    async def _exists_impl(self, id: str, entity: str) -> bool:
+        """Database-specific check that a document exists, without fetching it"""
+        pass
+
+    async def _prepare_for_save(
         self,
         entity: str,
         data: Dict[str, Any],
         is_update: bool = False
-    ) -> Tuple[Dict[str, Any], int]:
+    ) -> Tuple[str, Dict[str, Any]]:
         """
-        Create new document. If data contains 'id', use it as _id, otherwise auto-generate.
+        Validate a document for create/update and prepare it for storage.
 
         Args:
             entity: Entity type (e.g., "user", "account")
             data: Document data to save
-            validate: Unused parameter (validation handled at model layer)
+            is_update: True if the document must already exist
 
         Returns:
-            Tuple of (saved_document, count) where count is 1 if created, 0 if failed
+            Tuple of (id, prepared_data) where id is '' if it should be auto-generated
         """
         # remove the id from the data and pass it separately
         # orig = data.copy()
@@ -190,19 +287,16 @@ class DocumentManager(ABC):
         model_class = ModelService.get_model_class(entity)   #self._get_model_class(entity)
         validate_model(model_class, data, entity)
 
-        # Check if document exists for update
+        if is_update and not id:
+            Notification.error(HTTP.BAD_REQUEST, "Missing 'id' field or value for update operation", entity=entity, field="id")
+            raise  # Unreachable
+
+        # The update target check, unique constraint probes and fk lookups don't depend
+        # on each other - run them concurrently, then re-raise the first failure (in the
+        # order listed) once all of them have recorded their notifications
+        checks = []
         if is_update:
-            if not id:
-                Notification.error(HTTP.BAD_REQUEST, "Missing 'id' field or value for update operation", entity=entity, field="id")
-                raise  # Unreachable
-            try:
-                doc, count = await self._get_impl(id, entity)  # only check for existance - no validation
-                if count == 0:
-                    Notification.error(HTTP.NOT_FOUND, f"Document to update not found: {id}", entity=entity)
-            except DocumentNotFound:
-                Notification.error(HTTP.NOT_FOUND, f"Document to update not found: {id}", entity=entity)
-            except:
-                Notification.error(HTTP.INTERNAL_ERROR, f"Document error in update: {id}", entity=entity)
+            checks.append(self._check_update_target(entity, id))
 
         # Validate unique constraints from metadata (only for databases without native support)
         metadata = MetadataService.get(entity)
@@ -210,36 +304,75 @@ class DocumentManager(ABC):
         # Use database interface for database-level methods
         if unique_constraints and not self.database.supports_native_indexes():
             exclude_id = id if is_update else None
-            await validate_uniques(entity, data, unique_constraints, exclude_id)   # raise on failure
+            checks.append(validate_uniques(entity, data, unique_constraints, exclude_id))   # raise on failure
+
+        checks.append(self._check_fks(entity, data, is_update))
+
+        for result in await asyncio.gather(*checks, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
+
+        # Prepare data for database storage (database-specific)
+        prepared_data = self._prepare_datetime_fields(entity, data)
 
+        # Remove any sub-objects so we don't store them in the db
+        prepared_data = self._remove_sub_objects(entity, prepared_data)
+
+        return id, prepared_data
+
+    async def _check_update_target(self, entity: str, id: str) -> None:
+        """Raise (via Notification) unless the document to update exists"""
+        try:
+            exists = await self._exists_impl(id, entity)  # existence only - no document fetch or validation
+        except Exception:
+            Notification.error(HTTP.INTERNAL_ERROR, f"Document error in update: {id}", entity=entity)
+            raise  # Unreachable
+        if not exists:
+            Notification.error(HTTP.NOT_FOUND, f"Document to update not found: {id}", entity=entity)
+
+    async def _check_fks(self, entity: str, data: Dict[str, Any], is_update: bool) -> None:
+        """Raise (via Notification) if any foreign key of the document doesn't resolve"""
         # Process foreign keys (?view)
         result = await process_fks(entity, data, True)
-        if isinstance(result, bool) and result:
-            # Prepare data for database storage (database-specific)
-            prepared_data = self._prepare_datetime_fields(entity, data)
-
-            # Remove any sub-objects so we don't store them in the db
-            prepared_data = self._remove_sub_objects(entity, prepared_data)
-
-            # Save in database (database-specific implementation)
-            try:
-                if is_update:
-                    doc = await self._update_impl(entity, id, prepared_data)
-                    return {'id': id, **doc}, 1
-                else:
-                    doc = await self._create_impl(entity, id, prepared_data)
-                    return doc, 1
-            except DuplicateConstraintError as e:
-                Notification.error(HTTP.CONFLICT, f"Duplicate key error: {str(e)}")
-                raise  # Unreachable
-            except Exception as e:
-                operation = "update" if is_update else "create"
-                Notification.error(HTTP.INTERNAL_ERROR, f"{operation} error: {str(e)}")
-                raise  # Unreachable
-        else:
+        if not (isinstance(result, bool) and result):
             operation = "update" if is_update else "create"
             Notification.error(HTTP.UNPROCESSABLE, f"Foreign key validation of {result} failed for {operation}")
             raise  # Unreachable
+
+    async def _save_document(
+        self,
+        entity: str,
+        data: Dict[str, Any],
+        is_update: bool = False
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Create new document. If data contains 'id', use it as _id, otherwise auto-generate.
+
+        Args:
+            entity: Entity type (e.g., "user", "account")
+            data: Document data to save
+            validate: Unused parameter (validation handled at model layer)
+
+        Returns:
+            Tuple of (saved_document, count) where count is 1 if created, 0 if failed
+        """
+        id, prepared_data = await self._prepare_for_save(entity, data, is_update)
+
+        # Save in database (database-specific implementation)
+        try:
+            if is_update:
+                doc = await self._update_impl(entity, id, prepared_data)
+                return {'id': id, **doc}, 1
+            else:
+                doc = await self._create_impl(entity, id, prepared_data)
+                return doc, 1
+        except DuplicateConstraintError as e:
+            Notification.error(HTTP.CONFLICT, f"Duplicate key error: {str(e)}")
+            raise  # Unreachable
+        except Exception as e:
+            operation = "update" if is_update else "create"
+            Notification.error(HTTP.INTERNAL_ERROR, f"{operation} error: {str(e)}")
+            raise  # Unreachable
         
     async def create(
         self,
@@ -253,6 +386,87 @@ class DocumentManager(ABC):
     async def _create_impl(self, entity: str, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         pass
 
+    async def create_many(
+        self,
+        entity: str,
+        docs: List[Dict[str, Any]],
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Create several documents with a single bulk write.
+
+        Each document is validated exactly as create() does, then all of them are
+        written together instead of one database round trip per document. Documents
+        the database rejects (e.g. duplicate id) are reported as warnings and left out
+        of the result. Unique constraints are checked against stored data and between
+        documents of the same batch.
+
+        Returns:
+            Tuple of (saved_documents, count)
+        """
+        if not docs:
+            return [], 0
+
+        # Per-document checks (unique probes, fk lookups) are independent, so run them
+        # concurrently (bounded); every failure is recorded before the first one is re-raised
+        limit = asyncio.Semaphore(PREPARE_CONCURRENCY)
+
+        async def prepare(doc: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+            async with limit:
+                return await self._prepare_for_save(entity, doc, is_update=False)
+
+        results = await asyncio.gather(*(prepare(doc) for doc in docs), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        prepared: List[Tuple[str, Dict[str, Any]]] = list(results)  # type: ignore[arg-type]
+
+        # The probes above only see stored data, so two new documents of this batch
+        # could still share a unique value
+        metadata = MetadataService.get(entity)
+        unique_constraints = metadata.get('uniques', []) if metadata else []
+        if unique_constraints and not self.database.supports_native_indexes():
+            self._check_batch_uniques(entity, prepared, unique_constraints)
+
+        try:
+            saved = await self._create_many_impl(entity, prepared)
+        except Exception as e:
+            Notification.error(HTTP.INTERNAL_ERROR, f"bulk create error: {str(e)}")
+            raise  # Unreachable
+        return saved, len(saved)
+
+    @staticmethod
+    def _check_batch_uniques(entity: str, docs: List[Tuple[str, Dict[str, Any]]], unique_constraints: List[List[str]]) -> None:
+        """Raise (via Notification) if two documents of one batch collide on a unique constraint.
+
+        Strings are compared lowercased, matching the case-insensitive lookup of
+        _validate_unique_constraints.
+        """
+        for constraint_fields in unique_constraints:
+            seen: Set[Tuple[Any, ...]] = set()
+            for id, data in docs:
+                # Same field selection as the stored-data probe: only fields with a value
+                key = tuple(
+                    (field, data[field].lower() if isinstance(data[field], str) else data[field])
+                    for field in constraint_fields
+                    if data.get(field) is not None
+                )
+                if not key:
+                    continue
+                if key in seen:
+                    Notification.handle_duplicate_constraint(DuplicateConstraintError(
+                        message=f"Duplicate value for field '{constraint_fields[0]}'",
+                        entity=entity,
+                        field=constraint_fields[0],
+                        entity_id=id or "new"
+                    ))
+                    raise  # Unreachable
+                seen.add(key)
+
+    @abstractmethod
+    async def _create_many_impl(self, entity: str, docs: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Database-specific bulk insert of (id, prepared_data) pairs; returns the saved documents"""
+        pass
+
     async def update(
         self,
         entity: str,
@@ -295,7 +509,35 @@ class DocumentManager(ABC):
         """Get the core manager instance from the concrete implementation"""
         pass
 
+    def _from_field_metadata(self, purpose: str, entity: str, build: Callable[[Dict[str, Any]], T]) -> T:
+        """Value built from the entity's field metadata on first use, then reused.
+
+        Metadata is fixed after startup, and MetadataService.fields scans every entity,
+        so per-request paths read a derived value instead of walking metadata each time.
+        """
+        key = (purpose, entity)
+        if key not in self._field_metadata_cache:
+            self._field_metadata_cache[key] = build(MetadataService.fields(entity))
+        return self._field_metadata_cache[key]
+
+    def _fields_where(self, purpose: str, entity: str, predicate: Callable[[Dict[str, Any]], bool]) -> frozenset:
+        """Names of the entity's fields whose metadata satisfies predicate (cached per purpose)"""
+        return self._from_field_metadata(
+            purpose, entity,
+            lambda fields: frozenset(field for field, meta in fields.items() if predicate(meta))
+        )
+
+    def _get_datetime_fields(self, entity: str) -> frozenset:
+        """Fields _prepare_datetime_fields converts"""
+        return self._fields_where('datetime', entity, self._is_datetime_field)
+
     # Abstract methods for database-specific logic
+    @staticmethod
+    @abstractmethod
+    def _is_datetime_field(field_meta: Dict[str, Any]) -> bool:
+        """Whether a field's metadata marks it as a date the driver converts (database-specific)"""
+        pass
+
     @abstractmethod
     def _prepare_datetime_fields(self, entity: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert datetime fields for database storage (database-specific)"""
@@ -329,13 +571,20 @@ class DocumentManager(ABC):
 
     def _remove_sub_objects(self, entity: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Remove any sub-objects from the data before storing in the database"""
-        # look for any <field>id that are ObjectId types and remove the corresponding <field> sub-object
-        cleaned_data = data.copy()
-        for field in data:
-            if MetadataService.get(entity, field + "id", 'type') == 'ObjectId':
-                cleaned_data.pop(field)
-
-        return cleaned_data
+        sub_objects = self._sub_object_names(entity)
+        return {field: value for field, value in data.items() if field.lower() not in sub_objects}
+
+    def _sub_object_names(self, entity: str) -> frozenset:
+        """Lowercased names of the <field> sub-objects that may accompany ObjectId <field>id fields"""
+        # look for any <field>id that are ObjectId types; the corresponding <field> is a sub-object
+        return self._from_field_metadata(
+            'sub_objects', entity,
+            lambda fields: frozenset(
+                field.lower()[:-2]
+                for field, field_meta in fields.items()
+                if field_meta.get('type') == 'ObjectId' and field.lower().endswith('id')
+            )
+        )
 
 
 async def validate_uniques(entity: str, data: Dict[str, Any], unique_constraints: List[List[str]], exclude_id: Optional[str] = None) -> None:
@@ -385,15 +634,35 @@ def validate_model(cls, data: Dict[str, Any], entity_name: str):
     try:
         return cls.model_validate(data)
     except PydanticValidationError as e:
-        entity_id = data.get('id', 'unknown')
-        for error in e.errors():
-            field = str(error['loc'][-1]) if error.get('loc') else 'unknown'
-            Notification.warning(Warning.DATA_VALIDATION, "Validation error", entity=entity_name, entity_id=entity_id, field=field, value=error.get('msg', 'Validation error'))
-            success = False
+        notify_model_errors(entity_name, data, e.errors())
         # Return unvalidated instance so API can continue
         return cls.model_construct(**data)
 
 
+def notify_model_errors(entity_name: str, data: Dict[str, Any], errors: List[Any]) -> None:
+    """Report Pydantic validation errors of one document as warnings"""
+    entity_id = data.get('id', 'unknown')
+    for error in errors:
+        field = str(error['loc'][-1]) if error.get('loc') else 'unknown'
+        Notification.warning(Warning.DATA_VALIDATION, "Validation error", entity=entity_name, entity_id=entity_id, field=field, value=error.get('msg', 'Validation error'))
+
+
+def validate_models(cls, docs: List[Dict[str, Any]]) -> List[List[Any]]:
+    """
+    Pydantic-validate a page of documents and return each one's errors (empty if valid).
+    Touches no shared state, so a whole page can be handed to a worker thread
+    (asyncio.to_thread); the caller reports the errors with notify_model_errors.
+    """
+    page_errors: List[List[Any]] = []
+    for doc in docs:
+        try:
+            cls.model_validate(doc)
+            page_errors.append([])
+        except PydanticValidationError as e:
+            page_errors.append(e.errors())
+    return page_errors
+
+
 async def process_fks(entity: str, data: Dict[str, Any], validate: bool, view_spec: Dict[str, Any] = {}) -> Any:
     """
     Unified FK processing: validation + view population in single pass.
@@ -3,15 +3,50 @@ Elasticsearch core, entity, and index operations implementation.
 Contains ElasticsearchCore, ElasticsearchEntities, ElasticsearchIndexes and ElasticsearchDatabase classes.
 """
 
+import asyncio
+import copy
 import logging
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 from elasticsearch import AsyncElasticsearch
+from elasticsearch.exceptions import BadRequestError, NotFoundError
+
+try:
+    # Faster JSON encode/decode for request and response bodies when orjson is installed
+    from elasticsearch.serializer import OrjsonSerializer
+except ImportError:
+    OrjsonSerializer = None  # type: ignore[assignment,misc]
 
 from ..base import DatabaseInterface
 from ..core_manager import CoreManager
 from ..index_manager import IndexManager
 from app.services.metadata import MetadataService
+from app.config import Config
+from app.exceptions import DatabaseError
+
+# One client (and so one connection pool) per (url, database), shared process-wide.
+# _CLIENT_HOLDERS counts the initialized cores using each one; the client is closed
+# when the last of them closes.
+_CLIENTS: Dict[Tuple[str, str], AsyncElasticsearch] = {}
+_CLIENT_HOLDERS: Dict[Tuple[str, str], int] = {}
+
+# How long (seconds) a fetched index mapping is reused. Mappings grow as new fields
+# are indexed, so this is kept short.
+MAPPING_TTL = 5.0
+
+
+# Mapping of the synthetic hash field backing a multi-field unique constraint
+HASH_FIELD_MAPPING = {"type": "keyword", "normalizer": "lc"}
+
+# Gram length of the <field>.ngram subfield on string fields. Substring filters at least
+# this long match it as a phrase of grams instead of running a leading-wildcard query.
+SUBSTRING_GRAM = 3
+
+
+def _hash_field_name(fields: List[str]) -> str:
+    """Synthetic keyword field backing a multi-field unique constraint"""
+    return f"_hash_{'_'.join(sorted(fields))}"
 
 
 class ElasticsearchCore(CoreManager):
@@ -30,6 +65,21 @@ class ElasticsearchCore(CoreManager):
                                 "char_filter": [],
                                 "filter": ["lowercase"]
                             }
+                        },
+                        # String values exactly as ES echoes them back (template_ok compares)
+                        "tokenizer": {
+                            "substring_gram": {
+                                "type": "ngram",
+                                "min_gram": str(SUBSTRING_GRAM),
+                                "max_gram": str(SUBSTRING_GRAM)
+                            }
+                        },
+                        "analyzer": {
+                            "substring": {
+                                "type": "custom",
+                                "tokenizer": "substring_gram",
+                                "filter": ["lowercase"]
+                            }
                         }
                     }
                 }
@@ -46,7 +96,13 @@ class ElasticsearchCore(CoreManager):
                             "unmatch": "id",
                             "mapping": {
                                 "normalizer": "lc",
-                                "type": "keyword"
+                                "type": "keyword",
+                                "fields": {
+                                    "ngram": {
+                                        "type": "text",
+                                        "analyzer": "substring"
+                                    }
+                                }
                             },
                             "match_mapping_type": "string"
                         }
@@ -59,11 +115,14 @@ class ElasticsearchCore(CoreManager):
     def __init__(self, database):
         super().__init__(database)
         self._client: Optional[AsyncElasticsearch] = None
+        self._client_key: Optional[Tuple[str, str]] = None
         self._database_name: str = ""
+        self._mapping_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._mapping_locks: Dict[str, asyncio.Lock] = {}
+        self._serving_settings: Dict[str, Dict[str, Any]] = {}
     
-    @property
-    def id_field(self) -> str:
-        return "id"
+    # Plain class attribute rather than a property: read once per document on result paths
+    id_field = "id"
     
     async def init(self, connection_str: str, database_name: str) -> None:
         """Initialize Elasticsearch connection"""
@@ -71,13 +130,39 @@ class ElasticsearchCore(CoreManager):
             logging.info("ElasticsearchDatabase: Already initialized")
             return
 
-        self._client = AsyncElasticsearch([connection_str])
+        key = (connection_str, database_name)
+        client = _CLIENTS.get(key)
+        if client is None:
+            client_options: Dict[str, Any] = {}
+            if OrjsonSerializer is not None:
+                client_options["serializer"] = OrjsonSerializer()
+
+            # The default pool of 10 connections per node caps concurrent requests
+            client = AsyncElasticsearch(
+                [connection_str],
+                connections_per_node=Config.elasticsearch_max_connections(),
+                request_timeout=30,
+                # gzip request bodies and accept gzip responses - list and bulk payloads
+                # are repetitive JSON and compress several-fold
+                http_compress=True,
+                # Retry connection errors and 429/502/503/504 on another attempt, but not
+                # timeouts: a create that timed out may have been applied, and its retry
+                # would then fail as a false duplicate id
+                max_retries=3,
+                retry_on_timeout=False,
+                **client_options
+            )
+            _CLIENTS[key] = client
+
+        _CLIENT_HOLDERS[key] = _CLIENT_HOLDERS.get(key, 0) + 1
+        self._client = client
+        self._client_key = key
         self._database_name = database_name
 
         # Test connection
         await self._client.ping()
         self.database._initialized = True
-        logging.info(f"ElasticsearchDatabase: Connected to {database_name}")
+        logging.info("ElasticsearchDatabase: Connected to %s", database_name)
 
         # Create index template for simplified keyword approach
         await self._ensure_index_template()
@@ -88,7 +173,15 @@ class ElasticsearchCore(CoreManager):
     async def close(self) -> None:
         """Close Elasticsearch connection"""
         if self._client:
-            await self._client.close()
+            key = self._client_key
+            _CLIENT_HOLDERS[key] -= 1
+            # Other cores may still be using the shared client - only the last one closes it
+            if _CLIENT_HOLDERS[key] == 0:
+                del _CLIENT_HOLDERS[key]
+                del _CLIENTS[key]
+                await self._client.close()
+            self._client = None
+            self._client_key = None
             self.database._initialized = False
             logging.info("ElasticsearchDatabase: Connection closed")
 
@@ -98,22 +191,142 @@ class ElasticsearchCore(CoreManager):
     
     def get_id(self, document: Dict[str, Any]) -> Optional[str]:
         """Extract and normalize ID from Elasticsearch document"""
-        if not document:
-            return None
-        
-        id_value = document.get(self.id_field)
-        if id_value is None:
-            return None
-            
         # Elasticsearch _id is already a string, just return it
+        id_value = document.get(self.id_field) if document else None
         return str(id_value) if id_value else None
     
+    async def get_mapping_properties(self, index: str) -> Dict[str, Any]:
+        """Get the mapped field properties of an index, reusing a recent fetch.
+
+        Concurrent callers for the same index wait on one get_mapping request instead
+        of each sending their own. Raises NotFoundError if the index doesn't exist.
+        """
+        cached = self._mapping_cache.get(index)
+        if cached is not None and time.monotonic() - cached[0] < MAPPING_TTL:
+            return cached[1]
+
+        lock = self._mapping_locks.setdefault(index, asyncio.Lock())
+        async with lock:
+            # Another caller may have fetched it while we waited
+            cached = self._mapping_cache.get(index)
+            if cached is not None and time.monotonic() - cached[0] < MAPPING_TTL:
+                return cached[1]
+
+            response = await self.get_connection().indices.get_mapping(index=index)
+            properties = response.get(index, {}).get("mappings", {}).get("properties", {})
+            self._mapping_cache[index] = (time.monotonic(), properties)
+            return properties
+
+    def invalidate_mapping(self, index: Optional[str] = None) -> None:
+        """Forget a cached mapping (or all of them) after it was changed"""
+        if index is None:
+            self._mapping_cache.clear()
+        else:
+            self._mapping_cache.pop(index, None)
+
     def get_connection(self) -> AsyncElasticsearch:
         """Get Elasticsearch client instance"""
         if not self._client:
             raise RuntimeError("Elasticsearch not initialized")
         return self._client
 
+    # Index settings for bulk ingest: no periodic refresh, no replica writes and
+    # fsync of the translog in the background instead of on every request
+    BULK_LOAD_SETTINGS = {
+        "refresh_interval": "-1",
+        "number_of_replicas": 0,
+        "translog": {"durability": "async", "sync_interval": "30s", "flush_threshold_size": "1gb"}
+    }
+
+    # Settings restored once bulk ingest is done, if the index was created for the load
+    # (ES defaults)
+    SERVING_SETTINGS = {
+        "refresh_interval": "1s",
+        "number_of_replicas": 1,
+        "translog": {"durability": "request", "sync_interval": "5s", "flush_threshold_size": "512mb"}
+    }
+
+    async def prepare_bulk_load(self, entity: str) -> None:
+        """Switch an entity's index to bulk-ingest settings before a large create_many.
+
+        Not applied to indices by default: with refresh disabled, writes using the
+        strict-consistency 'wait_for' refresh would block until finalize_index runs,
+        and async translog durability can lose acknowledged writes on a node crash.
+        Callers must call finalize_index when the load completes; an existing index
+        gets back the settings it had before, not the ES defaults.
+        """
+        index = entity.lower()
+        es = self.get_connection()
+        if not await es.indices.exists(index=index):
+            await es.indices.create(index=index, settings=self.BULK_LOAD_SETTINGS)
+            return
+
+        if index not in self._serving_settings:
+            response = await es.indices.get_settings(index=index, include_defaults=True)
+            current = response.get(index, {})
+            settings = {**current.get("defaults", {}).get("index", {}), **current.get("settings", {}).get("index", {})}
+            translog = settings.get("translog", {})
+            # Every key BULK_LOAD_SETTINGS changes, so finalize_index puts all of them back
+            self._serving_settings[index] = {
+                "refresh_interval": settings.get("refresh_interval", self.SERVING_SETTINGS["refresh_interval"]),
+                "number_of_replicas": settings.get("number_of_replicas", self.SERVING_SETTINGS["number_of_replicas"]),
+                "translog": {
+                    key: translog.get(key, default)
+                    for key, default in self.SERVING_SETTINGS["translog"].items()
+                }
+            }
+        await es.indices.put_settings(index=index, settings=self.BULK_LOAD_SETTINGS)
+
+    async def finalize_index(self, entity: str) -> None:
+        """Restore serving settings after a bulk load and make the loaded documents searchable"""
+        index = entity.lower()
+        es = self.get_connection()
+        settings = self._serving_settings.pop(index, self.SERVING_SETTINGS)
+        await es.indices.put_settings(index=index, settings=settings)
+        await es.indices.refresh(index=index)
+
+    async def _list_user_indices(self, columns: str = "index", expand_wildcards: str = "open") -> List[Dict[str, Any]]:
+        """List non-system indices via _cat/indices.
+
+        System indices (dot-prefixed) are excluded server-side and only the requested
+        columns are returned, so ES does not ship rows and fields we would discard.
+        """
+        es = self.get_connection()
+        response = await es.cat.indices(index="*,-.*", h=columns, format="json", expand_wildcards=expand_wildcards)
+        return [idx for idx in response if isinstance(idx, dict) and isinstance(idx.get("index"), str)]
+
+    def expected_template(self) -> Dict[str, Any]:
+        """EXPECTED_TEMPLATE plus a leading rule for the string fields filtered only by exact term.
+
+        FK ids (ObjectId) and enums never use the <field>.ngram subfield, so they are mapped
+        without it. A name qualifies only if it is exact-match in every entity that has it;
+        a name that is free text anywhere keeps the subfield everywhere.
+        """
+        exact: Set[str] = set()
+        free_text: Set[str] = set()
+        for entity in MetadataService.list_entities():
+            for field, meta in MetadataService.fields(entity).items():
+                if meta.get('type') == 'ObjectId' or 'enum' in meta:
+                    exact.add(field)
+                elif meta.get('type', 'String') == 'String':
+                    free_text.add(field)
+        names = sorted(exact - free_text)
+
+        template = copy.deepcopy(self.EXPECTED_TEMPLATE)
+        if names:
+            template["template"]["mappings"]["dynamic_templates"].insert(0, {
+                "exact_strings_as_keyword": {
+                    "match_pattern": "regex",
+                    "match": f"^({'|'.join(names)})$",
+                    "mapping": {
+                        "normalizer": "lc",
+                        "type": "keyword"
+                    },
+                    "match_mapping_type": "string"
+                }
+            })
+        return template
+
     async def _ensure_index_template(self) -> None:
         """Create composable index template for simplified keyword approach with high priority."""
         # Check for conflicting templates first
@@ -133,14 +346,14 @@ class ElasticsearchCore(CoreManager):
 
             template_name = "app-keyword-template"
 
-            # Use the EXPECTED_TEMPLATE with dynamic index patterns
+            # Use the expected template with dynamic index patterns
             template_body = {
                 "index_patterns": index_patterns,
-                **self.EXPECTED_TEMPLATE
+                **self.expected_template()
             }
 
             await self._client.indices.put_index_template(name=template_name, body=template_body) # type: ignore
-            logging.info(f"Created index template: {template_name}")
+            logging.info("Created index template: %s", template_name)
 
     async def _validate_mappings_and_set_health(self) -> None:
         """Validate mappings and template state, set health accordingly without terminating."""
@@ -158,18 +371,9 @@ class ElasticsearchCore(CoreManager):
 
                 # Get all current indices for mapping validation
                 try:
-                    indices_response = await self._client.cat.indices(format="json")
-                    if indices_response:
-                        index_names = []
-                        for idx in indices_response:
-                            if isinstance(idx, dict) and "index" in idx:
-                                index_name = idx.get('index', None)
-                                if isinstance(index_name, str) and not index_name.startswith("."):
-                                    index_names.append(index_name)
-                    else:
-                        index_names = []
+                    index_names = [idx["index"] for idx in await self._list_user_indices()]
                 except Exception as e:
-                    logging.warning(f"Could not list indices for validation: {e}")
+                    logging.warning("Could not list indices for validation: %s", e)
                     self.database._health_state = "degraded"
                     return
 
@@ -178,8 +382,7 @@ class ElasticsearchCore(CoreManager):
                 for index_name in index_names:
                     try:
                         # Get mapping for this index
-                        response = await self._client.indices.get_mapping(index=index_name)
-                        properties = response.get(index_name, {}).get("mappings", {}).get("properties", {})
+                        properties = await self.get_mapping_properties(index_name)
 
                         # Check each field follows our template rules
                         for field, field_mapping in properties.items():
@@ -194,25 +397,25 @@ class ElasticsearchCore(CoreManager):
                                 violations.append(f"{index_name}.{field}: keyword field missing 'lc' normalizer")
 
                     except Exception as e:
-                        logging.warning(f"Could not validate mapping for {index_name}: {e}")
+                        logging.warning("Could not validate mapping for %s: %s", index_name, e)
                         continue
 
                 # Set health state based on findings
                 if template_conflict:
                     self.database._health_state = "conflict"
-                    logging.warning(f"DATABASE HEALTH: CONFLICT - Template conflicts detected")
+                    logging.warning("DATABASE HEALTH: CONFLICT - Template conflicts detected")
                 elif len(violations) > 0:
                     self.database._health_state = "degraded"
-                    logging.warning(f"DATABASE HEALTH: DEGRADED - Found {len(violations)} mapping violations:")
+                    logging.warning("DATABASE HEALTH: DEGRADED - Found %s mapping violations:", len(violations))
                     for violation in violations:
-                        logging.warning(f"  {violation}")
+                        logging.warning("  %s", violation)
                     logging.warning("Use /api/db/init to recreate indices with correct mappings")
                 else:
                     self.database._health_state = "healthy"
                     logging.info("DATABASE HEALTH: HEALTHY - All mappings compatible with template")
 
             except Exception as e:
-                logging.error(f"Health validation failed: {e}")
+                logging.error("Health validation failed: %s", e)
                 self.database._health_state = "degraded"
 
 
@@ -222,25 +425,19 @@ class ElasticsearchCore(CoreManager):
             self.database._ensure_initialized()
             es = self.get_connection()
 
-            # Get all current indices (excluding system indices)
-            indices_response = await es.cat.indices(format="json")
-            if indices_response:
-                user_indices = []
-                for idx in indices_response:
-                    if isinstance(idx, dict) and "index" in idx:
-                        index_name = idx.get('index', None)
-                        if isinstance(index_name, str) and not index_name.startswith("."):
-                            user_indices.append(index_name)
-            else:
-                user_indices = []
+            # Get all current indices (excluding system indices), closed ones included
+            user_indices = [idx["index"] for idx in await self._list_user_indices(expand_wildcards="all")]
 
             # Delete all user indices
+            self.invalidate_mapping()
             for index_name in user_indices:
                 try:
                     await es.indices.delete(index=index_name)
                 except Exception:
                     # Index might not exist, that's fine
                     pass
+            # After the deletes, so a get that raced them can't leave a document cached
+            self.database.documents.clear_get_cache()
 
             # Delete old template if it exists
             try:
@@ -263,7 +460,7 @@ class ElasticsearchCore(CoreManager):
             return True
 
         except Exception as e:
-            logging.error(f"Database wipe and reinit failed: {e}")
+            logging.error("Database wipe and reinit failed: %s", e)
             return False
 
     async def get_status_report(self) -> dict:
@@ -275,15 +472,8 @@ class ElasticsearchCore(CoreManager):
             # Get cluster info
             cluster_info = await es.info()
 
-            # Get all indices
-            indices_response = await es.cat.indices(format="json")
-            user_indices = []
-            if indices_response:
-                for idx in indices_response:
-                    if isinstance(idx, dict) and "index" in idx:
-                        index_name = idx.get("index", None)
-                        if isinstance(index_name, str) and not index_name.startswith("."):
-                            user_indices.append(idx)
+            # Get all user indices with just the columns the report needs
+            user_indices = await self._list_user_indices("index,docs.count,store.size")
 
             # Check mappings for violations
             violations = []
@@ -297,8 +487,7 @@ class ElasticsearchCore(CoreManager):
 
                 try:
                     # Get mapping
-                    mapping_response = await es.indices.get_mapping(index=index_name)
-                    properties = mapping_response.get(index_name, {}).get("mappings", {}).get("properties", {})
+                    properties = await self.get_mapping_properties(index_name)
 
                     # Analyze each field
                     fields = {}
@@ -340,36 +529,36 @@ class ElasticsearchCore(CoreManager):
 
                         if doc_count > 0:
                             try:
-                                # Get field stats using exists query for population
-                                exists_query = {
+                                # Population and cardinality in one count-only request: size 0
+                                # collects no hits, and track_total_hits makes the total exact
+                                # (the default stops counting at 10000). Documents without the
+                                # field add no values to the cardinality, so filtering to them
+                                # doesn't change it.
+                                # With keyword+lc normalizer, query fields directly
+                                stats_query = {
                                     "query": {"exists": {"field": field}},
-                                    "size": 0
+                                    "aggs": {
+                                        "unique_count": {
+                                            "cardinality": {"field": field}
+                                        }
+                                    },
+                                    "size": 0,
+                                    "track_total_hits": True
                                 }
-                                exists_response = await es.search(index=index_name, body=exists_query)
-                                non_null_count = exists_response.get("hits", {}).get("total", {}).get("value", 0)
+                                stats_response = await es.search(index=index_name, body=stats_query)
+                                non_null_count = stats_response.get("hits", {}).get("total", {}).get("value", 0)
                                 population_pct = int((non_null_count / doc_count) * 100)
                                 population = f"{population_pct}%"
 
-                                # Get cardinality using cardinality aggregation
                                 if non_null_count > 0:
-                                    # With keyword+lc normalizer, query fields directly
-                                    cardinality_query = {
-                                        "aggs": {
-                                            "unique_count": {
-                                                "cardinality": {"field": field}
-                                            }
-                                        },
-                                        "size": 0
-                                    }
-                                    cardinality_response = await es.search(index=index_name, body=cardinality_query)
-                                    unique_count = cardinality_response.get("aggregations", {}).get("unique_count", {}).get("value", 0)
+                                    unique_count = stats_response.get("aggregations", {}).get("unique_count", {}).get("value", 0)
                                     if unique_count > 0:
                                         cardinality_pct = int((unique_count / non_null_count) * 100)
                                         approx_uniques = f"{cardinality_pct}%"
 
                             except Exception as stats_error:
                                 # Stats failed, use defaults
-                                logging.warning(f"Field stats failed for {index_name}.{field}: {stats_error}")
+                                logging.warning("Field stats failed for %s.%s: %s", index_name, field, stats_error)
 
                         # For enums, flag high uniqueness as potential issue
                         approx_uniques_display = approx_uniques
@@ -406,7 +595,7 @@ class ElasticsearchCore(CoreManager):
                 if len(template_response.get("index_templates", [])) > 0:
                     # Template exists, check core structure (ignore index_patterns)
                     actual = template_response["index_templates"][0]["index_template"]["template"]
-                    expected = self.EXPECTED_TEMPLATE["template"]
+                    expected = self.expected_template()["template"]
                     template_ok = actual == expected
                 else:
                     template_ok = False
@@ -484,23 +673,29 @@ class ElasticsearchIndexes(IndexManager):
         self.database._ensure_initialized()
         es = self.database.core.get_connection()
 
-        # Ensure index exists - template will apply keyword+lc normalizer automatically
-        if not await es.indices.exists(index=entity.lower()):
+        # Ensure index exists - template will apply keyword+lc normalizer automatically.
+        # Create unconditionally; resource_already_exists means it was already there.
+        # Any other 400 (bad name, bad settings) is a real failure.
+        try:
             await es.indices.create(index=entity.lower())
+        except BadRequestError as e:
+            if e.error != "resource_already_exists_exception":
+                raise DatabaseError(f"Failed to create index for {entity}: {e}")
 
         # For multi-field unique constraints, create hash field with lc normalizer
         if len(fields) > 1:
-            hash_field = f"_hash_{'_'.join(sorted(fields))}"
-            properties = {
-                hash_field: {
-                    "type": "keyword",
-                    "normalizer": "lc"
-                }
-            }
-            await es.indices.put_mapping(
-                index=entity.lower(),
-                properties=properties
-            )
+            hash_field = _hash_field_name(fields)
+            properties = {hash_field: HASH_FIELD_MAPPING}
+            # put_mapping merges; re-sending an identical field is a no-op, so no need to
+            # read the mapping first. Only a conflicting existing definition fails.
+            try:
+                await es.indices.put_mapping(
+                    index=entity.lower(),
+                    properties=properties
+                )
+            except BadRequestError as e:
+                raise DatabaseError(f"Mapping conflict for {entity}.{hash_field}: {e}")
+            self.database.core.invalidate_mapping(entity.lower())
 
         # Single-field constraints don't need explicit mapping - template handles it
     
@@ -512,21 +707,19 @@ class ElasticsearchIndexes(IndexManager):
         and verify they exist in the index mapping.
         """
         self.database._ensure_initialized()
-        es = self.database.core.get_connection()
 
         # Get expected unique constraints from metadata
         metadata = MetadataService.get(entity)
         expected_uniques = metadata.get('uniques', [])
 
-        if not await es.indices.exists(index=entity.lower()):
+        # Get current mapping
+        try:
+            mapping = await self.database.core.get_mapping_properties(entity.lower())
+        except NotFoundError:
             # Index doesn't exist yet - return empty list
             # (create() will create the index when called)
             return []
 
-        # Get current mapping
-        response = await es.indices.get_mapping(index=entity.lower())
-        mapping = response.get(entity.lower(), {}).get("mappings", {}).get("properties", {})
-
         # Check which unique constraints are set up
         existing_constraints = []
 
@@ -538,7 +731,7 @@ class ElasticsearchIndexes(IndexManager):
                     existing_constraints.append(constraint_fields)
             else:
                 # Multi-field - check if hash field exists
-                hash_field = f"_hash_{'_'.join(sorted(constraint_fields))}"
+                hash_field = _hash_field_name(constraint_fields)
                 if hash_field in mapping:
                     # Also verify all individual fields exist
                     if all(field in mapping for field in constraint_fields):
@@ -564,7 +757,7 @@ class ElasticsearchIndexes(IndexManager):
                     "type": "synthetic"
                 }
         except Exception as e:
-            self.logger.error(f"Elasticsearch get detailed indexes error: {str(e)}")
+            self.logger.error("Elasticsearch get detailed indexes error: %s", e)
 
         return indexes
 
@@ -579,7 +772,11 @@ class ElasticsearchIndexes(IndexManager):
         # 2. Reindex all data from old to new index  
         # 3. Delete old index and alias new index to old name
         # This is complex and not commonly done in production
-        pass
+        logging.warning(
+            "Elasticsearch cannot remove mapped fields; unique constraint on "
+            "%s.%s left in place (reindex into a new index to drop it)",
+            entity, '+'.join(fields)
+        )
 
 
 class ElasticsearchDatabase(DatabaseInterface):
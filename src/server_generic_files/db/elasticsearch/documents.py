@@ -3,25 +3,154 @@ Elasticsearch document operations implementation.
 Contains the ElasticsearchDocuments class with CRUD operations.
 """
 
+import asyncio
+import json
 import logging
+import time
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
-from elasticsearch.exceptions import NotFoundError
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Literal, Optional, Set, Tuple, Union
+from elasticsearch import AsyncElasticsearch
+from elasticsearch.exceptions import ConflictError, NotFoundError
+from elasticsearch.helpers import async_streaming_bulk
 
 from ..document_manager import DocumentManager
 from ..core_manager import CoreManager
 from app.exceptions import DocumentNotFound, DatabaseError, DuplicateConstraintError
 from app.services.metadata import MetadataService
-from app.services.notify import Notification
+from app.services.notify import Notification, Warning
 from app.services.request_context import RequestContext
 from app.config import Config
+from .core import SUBSTRING_GRAM
+
+# Bulk helper chunking: flush after this many actions or bytes, whichever comes first
+BULK_CHUNK_SIZE = 500
+BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+
+# Bulk helper retries of actions rejected with 429 (cluster busy), backing off from
+# BULK_INITIAL_BACKOFF seconds and doubling each time. The helper default is no retry,
+# which turns a momentary overload into per-document failures.
+BULK_MAX_RETRIES = 3
+BULK_INITIAL_BACKOFF = 1
+
+# Distinct values up to which the collapsed total (a cardinality aggregation) is
+# counted near-exactly; the ES maximum. Above it the total is an estimate, and the
+# aggregation uses about 8 bytes of memory per unit of threshold per shard.
+CARDINALITY_PRECISION = 40000
+
+# Max documents held by the optional get-by-id cache (see Config.elasticsearch_get_cache_seconds)
+GET_CACHE_SIZE = 1024
+
+# Shared query pieces for the common unfiltered / unsorted list request. Sent as-is by
+# the client and never mutated, so one instance serves every request.
+MATCH_ALL_QUERY: Dict[str, Any] = {"match_all": {}}
+DEFAULT_SORT: List[Dict[str, Any]] = [{"id": {"order": "asc"}}]
+
+# Values accepted by the ES refresh parameter on writes
+RefreshMode = Union[bool, Literal["wait_for"]]
+
+
+class _WriteBuffer:
+    """Coalesces single-document writes into _bulk requests.
+
+    Each submit() waits until its action has been sent as part of a batch and returns
+    that action's bulk result item. A batch is cut as soon as it holds BULK_CHUNK_SIZE
+    actions or the next action would take it past BULK_MAX_CHUNK_BYTES, and otherwise
+    when the delay since its first action expires. The batch is sent with the
+    strongest refresh mode any of its writers asked for.
+    """
+
+    def __init__(self, get_connection: Callable[[], AsyncElasticsearch], delay: float):
+        self._get_connection = get_connection
+        self._delay = delay
+        self._pending: List[Tuple[Dict[str, Any], Dict[str, Any], RefreshMode, asyncio.Future]] = []
+        self._pending_bytes = 0
+        self._timer: Optional[asyncio.Task] = None
+        # The loop only holds weak references to tasks; keep in-flight sends alive
+        self._sends: Set[asyncio.Task] = set()
+
+    async def submit(self, header: Dict[str, Any], doc: Dict[str, Any], refresh: RefreshMode) -> Dict[str, Any]:
+        future = asyncio.get_running_loop().create_future()
+        size = _action_size(header, doc)
+
+        # Cut the waiting batch first if this action would push it over the byte limit
+        if self._pending and self._pending_bytes + size > BULK_MAX_CHUNK_BYTES:
+            self._send_in_background(self._take_pending())
+
+        self._pending.append((header, doc, refresh, future))
+        self._pending_bytes += size
+
+        if len(self._pending) >= BULK_CHUNK_SIZE:
+            self._send_in_background(self._take_pending())
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_delay())
+
+        return await future
+
+    def _take_pending(self) -> List[Tuple[Dict[str, Any], Dict[str, Any], RefreshMode, asyncio.Future]]:
+        """Remove the waiting batch; the next submit starts a new one (and a new timer)"""
+        batch, self._pending, self._pending_bytes = self._pending, [], 0
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _send_in_background(self, batch) -> None:
+        task = asyncio.create_task(self._send(batch))
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self._delay)
+        self._timer = None  # this task is finishing - _take_pending must not cancel it
+        await self._send(self._take_pending())
+
+    async def _send(self, batch) -> None:
+        if not batch:
+            return
+
+        modes = {refresh for _, _, refresh, _ in batch}
+        refresh: RefreshMode = True if True in modes else "wait_for" if "wait_for" in modes else False
+
+        operations: List[Dict[str, Any]] = []
+        for header, doc, _, _ in batch:
+            operations.append(header)
+            operations.append(doc)
+
+        try:
+            response = await self._get_connection().bulk(operations=operations, refresh=refresh)
+        except Exception as e:
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, _, future), item in zip(batch, response.get("items", [])):
+            if not future.done():
+                future.set_result(next(iter(item.values())))
+
+        # A short response must not leave writers waiting forever
+        for _, _, _, future in batch:
+            if not future.done():
+                future.set_exception(DatabaseError("Elasticsearch bulk response is missing an item for this write"))
+
+
+def _action_size(header: Dict[str, Any], doc: Dict[str, Any]) -> int:
+    """Approximate serialized size of one bulk action (header + source lines)"""
+    return len(json.dumps(header)) + len(json.dumps(doc, default=str)) + 2
 
 
 class ElasticsearchDocuments(DocumentManager):
     """Elasticsearch implementation of document operations"""
-    
+
     def __init__(self, database):
         super().__init__(database)
+        self._write_buffer: Optional[_WriteBuffer] = None
+        self._get_cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def clear_get_cache(self) -> None:
+        """Forget every cached get-by-id result (e.g. after the indices were dropped)"""
+        self._get_cache.clear()
 
     def _get_proper_sort_fields(self, sort_fields: Optional[List[Tuple[str, str]]], entity: str) -> Optional[List[Tuple[str, str]]]:
         """Get sort fields with proper case names"""
@@ -72,27 +201,36 @@ class ElasticsearchDocuments(DocumentManager):
         sort: Optional[List[Tuple[str, str]]] = None,
         filter: Optional[Dict[str, Any]] = None,
         page: int = 1,
-        pageSize: int = 25
+        pageSize: int = 25,
+        collapse_field: Optional[str] = None,
+        source_includes: Optional[List[str]] = None
     ) -> Tuple[List[Dict[str, Any]], int]:
-        """Get paginated list of documents"""
+        """Get paginated list of documents
+
+        If collapse_field is given, ES collapses hits on that (keyword) field so only
+        one document per distinct value is returned, and the total is the distinct
+        count from a cardinality aggregation rather than the raw hit count. That count
+        is approximate: near-exact up to CARDINALITY_PRECISION distinct values, an
+        estimate (typically within a few percent) beyond.
+
+        If source_includes is given, only those _source fields are returned.
+        """
         self.database._ensure_initialized()
         es = self.database.core.get_connection()
 
         # Convert entity to lowercase for ES index names
         index_name = entity.lower()
 
-        if not await es.indices.exists(index=index_name):
-            return [], 0
-
         # Convert field names to proper case using metadata
         proper_sort = self._get_proper_sort_fields(sort, entity)
         proper_filter = self._get_proper_filter_fields(filter, entity)
 
         # Build query
+        ngram_fields = await self._get_ngram_fields(index_name) if proper_filter else frozenset()
         query_body = {
             "from": (page - 1) * pageSize,
             "size": pageSize,
-            "query": self._build_query_filter(proper_filter, entity)
+            "query": self._build_query_filter(proper_filter, entity, ngram_fields)
         }
 
         # Add sorting (only if sort spec is not empty)
@@ -100,50 +238,161 @@ class ElasticsearchDocuments(DocumentManager):
         if sort_spec:
             query_body["sort"] = sort_spec
 
-        # Execute query
-        response = await es.search(index=index_name, body=query_body)
+        # Server-side dedup: one hit per distinct value, counted with cardinality
+        if collapse_field:
+            proper_collapse = MetadataService.get_proper_name(entity, collapse_field) or collapse_field
+            query_body["collapse"] = {"field": proper_collapse}
+            query_body["aggs"] = {"distinct_count": {"cardinality": {
+                "field": proper_collapse,
+                "precision_threshold": CARDINALITY_PRECISION
+            }}}
+            # Total comes from the aggregation, so don't count raw hits as well
+            query_body["track_total_hits"] = False
+
+        # Execute query - filter_path drops per-hit _index/_id/_score and shard stats
+        # from the response; only _source, the total and the aggregation are read.
+        # A missing index yields an empty result (ignore_unavailable) rather than
+        # waiting on a separate exists check before the search can start.
+        response = await es.search(
+            index=index_name,
+            body=query_body,
+            _source_includes=source_includes,
+            ignore_unavailable=True,
+            filter_path=["hits.hits._source", "hits.total", "aggregations"]
+        )
         hits = response.get("hits", {}).get("hits", [])
 
-        documents = []
-        for hit in hits:
-            # doc = self._normalize_document(hit["_source"])
-            documents.append(hit["_source"])
+        # _source already carries 'id', so each hit's dict is returned as-is - no per-doc merge
+        documents = [hit["_source"] for hit in hits]
 
-        total_count = response.get("hits", {}).get("total", {}).get("value", 0)
+        if collapse_field:
+            total_count = response.get("aggregations", {}).get("distinct_count", {}).get("value", 0)
+        else:
+            total_count = response.get("hits", {}).get("total", {}).get("value", 0)
 
         return documents, total_count
     
+    async def iter_all(
+        self,
+        entity: str,
+        page_size: int = 1000,
+        source_includes: Optional[List[str]] = None,
+        ids_only: bool = False
+    ) -> AsyncIterator[List[Any]]:
+        """Yield every document of an entity, one page at a time.
+
+        Pages through a point-in-time (PIT) snapshot with search_after, so unlike
+        _get_all_impl it is not capped by index.max_result_window and only one page is
+        held in memory. Documents written during the iteration are not seen. Hits are
+        in _shard_doc order and the total hit count is not computed. The PIT is
+        always closed.
+
+        If ids_only is set, _source is not fetched at all and each page is a list of ids.
+        """
+        self.database._ensure_initialized()
+        es = self.database.core.get_connection()
+
+        try:
+            pit = await es.open_point_in_time(index=entity.lower(), keep_alive="1m")
+        except NotFoundError:
+            return  # Index doesn't exist yet
+        pit_id = pit["id"]
+
+        search_after = None
+        try:
+            while True:
+                response = await es.search(
+                    pit={"id": pit_id, "keep_alive": "1m"},
+                    size=page_size,
+                    query={"match_all": {}},
+                    sort=[{"_shard_doc": "asc"}],
+                    search_after=search_after,
+                    track_total_hits=False,
+                    **({"_source": False} if ids_only else {"_source_includes": source_includes})
+                )
+                pit_id = response.get("pit_id", pit_id)
+
+                hits = response.get("hits", {}).get("hits", [])
+                if not hits:
+                    break
+                yield [hit["_id"] for hit in hits] if ids_only else [hit["_source"] for hit in hits]
+
+                search_after = hits[-1]["sort"]
+        finally:
+            await es.close_point_in_time(id=pit_id)
+
+    async def list_ids(self, entity: str, page_size: int = 1000) -> List[str]:
+        """Return the ids of every document of an entity without loading any _source"""
+        ids: List[str] = []
+        async for page in self.iter_all(entity, page_size=page_size, ids_only=True):
+            ids.extend(page)
+        return ids
+
     async def _get_impl(
         self,
         id: str,
         entity: str,
+        source_includes: Optional[List[str]] = None
     ) -> Tuple[Dict[str, Any], int]:
-        """Get single document by ID"""
+        """Get single document by ID, optionally projected to source_includes fields.
+        A missing index comes back from ES as a 404 like a missing document."""
         self.database._ensure_initialized()
         es = self.database.core.get_connection()
 
         index = entity.lower()
 
-        if not await es.indices.exists(index=index):
-            raise DocumentNotFound(None, f"Index {index} does not exist")
+        ttl = Config.elasticsearch_get_cache_seconds()
+        cacheable = ttl > 0 and not source_includes
+        if cacheable:
+            cached = self._get_cache.get((index, id))
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                self._get_cache.move_to_end((index, id))
+                return dict(cached[1]), 1  # callers normalize (mutate) the returned doc
 
         try:
-            response = await es.get(index=index, id=id)
+            response = await es.get(index=index, id=id, _source_includes=source_includes)
             # doc = self._normalize_document(response["_source"])
-            return response["_source"], 1
+            doc = response["_source"]
         except NotFoundError as e:
             raise DocumentNotFound(e)
+
+        if cacheable:
+            self._get_cache[(index, id)] = (time.monotonic(), dict(doc))
+            self._get_cache.move_to_end((index, id))
+            if len(self._get_cache) > GET_CACHE_SIZE:
+                self._get_cache.popitem(last=False)
+        return doc, 1
     
+    async def _get_many_impl(self, ids: List[str], entity: str) -> Dict[str, Dict[str, Any]]:
+        """Get several documents with one _mget request instead of a GET per id"""
+        self.database._ensure_initialized()
+        es = self.database.core.get_connection()
+
+        if not ids:
+            return {}
+
+        try:
+            response = await es.mget(index=entity.lower(), ids=ids)
+        except NotFoundError:
+            return {}  # Index doesn't exist yet
+
+        return {doc["_id"]: doc["_source"] for doc in response.get("docs", []) if doc.get("found")}
+
+    async def _exists_impl(self, id: str, entity: str) -> bool:
+        """Check document existence with a HEAD request - no _source is fetched.
+        A missing index is reported as a missing document."""
+        self.database._ensure_initialized()
+        es = self.database.core.get_connection()
+
+        return bool(await es.exists(index=entity.lower(), id=id))
+
     async def _delete_impl(self, id: str, entity: str) -> Tuple[Dict[str, Any], int]:
-        """Delete document by ID"""
+        """Delete document by ID. A missing index surfaces as a 404 from the get below."""
         self.database._ensure_initialized()
         es = self.database.core.get_connection()
 
         index = entity.lower()
 
-        if not await es.indices.exists(index=index):
-            return {}, 0
-
         # Elasticsearch doesn't return deleted doc automatically, so fetch it first
         try:
             # Get document before deleting
@@ -152,8 +401,7 @@ class ElasticsearchDocuments(DocumentManager):
             # Delete with optional refresh for consistency
             # This ensures deleted documents are immediately removed from search results,
             # preventing false duplicate errors when re-creating with same unique values
-            refresh_mode = 'wait_for' if (Config.elasticsearch_strict_consistency() and not RequestContext.no_consistency) else False
-            delete_response = await es.delete(index=index, id=id, refresh=refresh_mode)
+            delete_response = await es.delete(index=index, id=id, refresh=self._refresh_mode())
             if delete_response.get("result") == "deleted":
                 return doc, 1
             else:
@@ -164,47 +412,214 @@ class ElasticsearchDocuments(DocumentManager):
             raise DocumentNotFound(entity, id)
         except Exception as e:
             raise DatabaseError(f"Elasticsearch delete error: {str(e)}")
-    
+        finally:
+            # After the delete, so a get that raced it can't leave the document cached
+            self._get_cache.pop((index, id), None)
+
+    async def delete_many(self, ids: List[str], entity: str, refresh: Optional[RefreshMode] = None) -> int:
+        """Delete several documents by ID through the streaming bulk helper.
+
+        Unlike delete(), the deleted documents are not fetched first, and IDs are
+        sent in _bulk chunks rather than one request each. Missing IDs (404) are
+        ignored; any other per-document failure raises DatabaseError once the whole
+        batch has been sent.
+
+        Args:
+            refresh: Explicit refresh mode; None applies the consistency policy (see _refresh_mode)
+
+        Returns:
+            Number of documents actually deleted
+        """
+        self.database._ensure_initialized()
+        es = self.database.core.get_connection()
+
+        if not ids:
+            return 0
+
+        index = entity.lower()
+        actions = ({"_op_type": "delete", "_index": index, "_id": id} for id in ids)
+
+        deleted = 0
+        failed: List[str] = []
+        try:
+            async for ok, item in async_streaming_bulk(
+                es,
+                actions,
+                chunk_size=BULK_CHUNK_SIZE,
+                max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+                max_retries=BULK_MAX_RETRIES,
+                initial_backoff=BULK_INITIAL_BACKOFF,
+                raise_on_error=False,
+                refresh=self._refresh_mode(refresh)
+            ):
+                result = item.get("delete", {})
+                if ok:
+                    if result.get("result") == "deleted":
+                        deleted += 1
+                elif result.get("status") != 404:
+                    # Not-found deletes are simply not counted; anything else is a real failure
+                    failed.append(f"{result.get('_id')}: {result.get('error')}")
+        except Exception as e:
+            raise DatabaseError(f"Elasticsearch bulk delete error: {str(e)}")
+        finally:
+            # After the deletes, so a get that raced them can't leave a document cached
+            for id in ids:
+                self._get_cache.pop((index, id), None)
+
+        if failed:
+            raise DatabaseError(f"Elasticsearch bulk delete failed for {len(failed)} of {len(ids)} documents "
+                                f"({deleted} deleted): {'; '.join(failed[:5])}")
+
+        return deleted
+
     async def _create_impl(self, entity: str, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create document in Elasticsearch. If data contains 'id', use it as _id, otherwise auto-generate."""
+        """Create document in Elasticsearch. If data contains 'id', use it as _id, otherwise auto-generate.
+
+        Uses op_type=create so ES itself rejects an _id that already exists instead
+        of silently overwriting it - atomic, with no extra existence round trip.
+        """
+        return await self._index_document(entity, id, data, op_type="create")
+
+    async def _update_impl(self, entity: str, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        # update is a plain index in ES - it replaces the whole document
+        try:
+            return await self._index_document(entity, id, data, op_type="index")
+        finally:
+            # A get that raced the write may have re-cached the old version
+            self._get_cache.pop((entity.lower(), id), None)
+
+    async def _create_many_impl(
+        self,
+        entity: str,
+        docs: List[Tuple[str, Dict[str, Any]]],
+        refresh: Optional[RefreshMode] = None
+    ) -> List[Dict[str, Any]]:
+        """Create prepared documents through the streaming bulk helper.
+
+        Each document is a 'create' action (same semantics as _create_impl), sent in
+        _bulk chunks instead of one index request per document.
+        """
+        es = self.database.core.get_connection()
+
+        index = entity.lower()
+
+        documents = []
+        for id, data in docs:
+            data['id'] = id or str(uuid.uuid4())
+            documents.append(data)
+
+        actions = (
+            {"_op_type": "create", "_index": index, "_id": data['id'], "_source": data}
+            for data in documents
+        )
+
+        saved_ids = set()
+        async for ok, item in async_streaming_bulk(
+            es,
+            actions,
+            chunk_size=BULK_CHUNK_SIZE,
+            max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+            max_retries=BULK_MAX_RETRIES,
+            initial_backoff=BULK_INITIAL_BACKOFF,
+            raise_on_error=False,
+            refresh=self._refresh_mode(refresh)
+        ):
+            result = item.get("create", {})
+            if ok:
+                saved_ids.add(result.get("_id"))
+            elif result.get("status") == 409:
+                Notification.warning(Warning.UNIQUE_VIOLATION, "Document id already exists", entity=entity, entity_id=result.get("_id", ""))
+            else:
+                Notification.warning(Warning.DATA_VALIDATION, f"Bulk create failed: {result.get('error')}", entity=entity, entity_id=result.get("_id", ""))
+
+        return [data for data in documents if data['id'] in saved_ids]
+
+    async def _index_document(
+        self,
+        entity: str,
+        id: str,
+        data: Dict[str, Any],
+        op_type: str,
+        refresh: Optional[RefreshMode] = None
+    ) -> Dict[str, Any]:
+        """Index a prepared document and return it with its id"""
         es = self.database.core.get_connection()
 
         index = entity.lower()
-        create_data = data.copy()
 
         # If an 'id' was specified, use it as Elasticsearch _id
         if not id:
             id = str(uuid.uuid4())
 
-        # Store shadow id field for sorting (not _id - that's metadata)
-        create_data['id'] = id
+        self._get_cache.pop((index, id), None)
 
-        # Use refresh='wait_for' if strict consistency is enabled (default)
-        # This ensures document is searchable immediately, which is critical for
-        # duplicate constraint validation to work correctly with concurrent requests.
-        # Can be disabled via:
-        #   1. elasticsearch_strict_consistency=false config (global)
-        #   2. ?no_consistency=true query param (per-request, for bulk loads)
-        refresh_mode = 'wait_for' if (Config.elasticsearch_strict_consistency() and not RequestContext.no_consistency) else False
-        await es.index(index=index, id=id, body=create_data, refresh=refresh_mode)
+        # Store shadow id field for sorting (not _id - that's metadata).
+        # data is the prepared copy built by _save_document, so write into it directly
+        data['id'] = id
 
-        return create_data
+        buffer_ms = Config.elasticsearch_write_buffer_ms()
+        if buffer_ms > 0:
+            if self._write_buffer is None:
+                self._write_buffer = _WriteBuffer(self.database.core.get_connection, buffer_ms / 1000)
+            result = await self._write_buffer.submit(
+                {op_type: {"_index": index, "_id": id}}, data, self._refresh_mode(refresh)
+            )
+            if result.get("status") == 409:
+                raise DuplicateConstraintError(
+                    message=f"Document with id '{id}' already exists",
+                    entity=entity,
+                    field="id",
+                    entity_id=id
+                )
+            if "error" in result:
+                raise DatabaseError(f"Elasticsearch {op_type} error: {result['error']}")
+            return data
+
+        try:
+            await es.index(index=index, id=id, body=data, op_type=op_type, refresh=self._refresh_mode(refresh))
+        except ConflictError:
+            raise DuplicateConstraintError(
+                message=f"Document with id '{id}' already exists",
+                entity=entity,
+                field="id",
+                entity_id=id
+            )
+
+        return data
+
+    def _refresh_mode(self, refresh: Optional[RefreshMode] = None) -> RefreshMode:
+        """Resolve the refresh mode for a write.
+
+        An explicit value from the caller wins. Otherwise use refresh='wait_for' if
+        strict consistency is enabled (default): the write blocks until the next
+        scheduled refresh makes it searchable, which duplicate constraint validation
+        relies on under concurrent requests. Never refresh=True - forcing a refresh per
+        write creates a new segment each time and collapses write throughput.
+        Can be disabled (refresh=False, ES refreshes on its own interval) via:
+          1. elasticsearch_strict_consistency=false config (global)
+          2. ?no_consistency=true query param (per-request, for bulk loads)
+        """
+        if refresh is not None:
+            return refresh
+        return 'wait_for' if (Config.elasticsearch_strict_consistency() and not RequestContext.no_consistency) else False
 
-    async def _update_impl(self, entity: str, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        # update is the same as create in ES - it will upsert
-        return await self._create_impl(entity, id, data)
-    
     def _get_core_manager(self) -> CoreManager:
         """Get the core manager instance"""
         return self.database.core
     
-    def _build_query_filter(self, filters: Optional[Dict[str, Any]], entity: str) -> Dict[str, Any]:
-        """Build Elasticsearch query from filter conditions"""
+    def _build_query_filter(self, filters: Optional[Dict[str, Any]], entity: str,
+                            ngram_fields: frozenset = frozenset()) -> Dict[str, Any]:
+        """Build Elasticsearch query from filter conditions
+
+        ngram_fields: string fields mapped with a <field>.ngram subfield (see _get_ngram_fields)
+        """
         if not filters:
-            return {"match_all": {}}
+            return MATCH_ALL_QUERY
 
-        must_clauses = []
-        fields_meta = MetadataService.fields(entity)
+        # Filter context: results are always field-sorted, so scores are never used, and
+        # filter clauses are eligible for the node query cache across requests
+        filter_clauses = []
+        exact_match_fields = self._get_exact_match_fields(entity)
 
         for field, value in filters.items():
             if isinstance(value, dict) and any(op in value for op in ['$gte', '$lte', '$gt', '$lt']):
@@ -213,24 +628,47 @@ class ElasticsearchDocuments(DocumentManager):
                 for op, val in value.items():
                     es_op = op.replace('$', '')  # $gte -> gte
                     range_query[es_op] = val
-                must_clauses.append({"range": {field: range_query}})
+                filter_clauses.append({"range": {field: range_query}})
             else:
-                # Check field metadata to determine match strategy
-                field_meta = fields_meta.get(field, {})
-                field_type = field_meta.get('type', 'String')
-                has_enum_values = 'enum' in field_meta
-
-                if field_type == 'String' and not has_enum_values:
-                    # Non-enum strings: substring match (anywhere in string)
-                    # Lowercase value since fields use lc normalizer
-                    value_lower = str(value).lower()
-                    must_clauses.append({"wildcard": {field: f"*{value_lower}*"}})
-                else:
+                if field in exact_match_fields:
                     # Enum fields and non-strings: exact match
-                    must_clauses.append({"term": {field: value}})
-
-        return {"bool": {"must": must_clauses}} if must_clauses else {"match_all": {}}
+                    filter_clauses.append({"term": {field: value}})
+                else:
+                    # Non-enum strings: substring match (anywhere in string)
+                    value_str = str(value)
+                    if field in ngram_fields and len(value_str) >= SUBSTRING_GRAM:
+                        # Consecutive grams of the value, looked up in the inverted index
+                        filter_clauses.append({"match_phrase": {f"{field}.ngram": value_str}})
+                    else:
+                        # Leading wildcard walks the field's whole term dictionary; only for
+                        # short values or indices created before the ngram subfield existed.
+                        # Lowercase value since fields use lc normalizer
+                        filter_clauses.append({"wildcard": {field: f"*{value_str.lower()}*"}})
+
+        return {"bool": {"filter": filter_clauses}} if filter_clauses else MATCH_ALL_QUERY
     
+    async def _get_ngram_fields(self, index: str) -> frozenset:
+        """Fields of the index mapped with the <field>.ngram substring subfield"""
+        try:
+            properties = await self.database.core.get_mapping_properties(index)
+        except NotFoundError:
+            return frozenset()
+        return frozenset(
+            field for field, mapping in properties.items()
+            if "ngram" in mapping.get("fields", {})
+        )
+
+    def _get_exact_match_fields(self, entity: str) -> frozenset:
+        """Fields filtered by exact term match (enums and non-strings).
+
+        Every other field, including ones without metadata (default type String), is
+        filtered by substring match.
+        """
+        return self._fields_where(
+            'exact_match', entity,
+            lambda meta: meta.get('type', 'String') != 'String' or 'enum' in meta
+        )
+
     def _build_sort_spec(self, sort_fields: Optional[List[Tuple[str, str]]], entity: str) -> List[Dict[str, Any]]:
         """Build Elasticsearch sort specification
 
@@ -240,7 +678,7 @@ class ElasticsearchDocuments(DocumentManager):
         """
         if not sort_fields:
             # Default sort by 'id' field for consistent pagination
-            return [{"id": {"order": "asc"}}]
+            return DEFAULT_SORT
 
         sort_spec = []
         for field, direction in sort_fields:
@@ -252,18 +690,22 @@ class ElasticsearchDocuments(DocumentManager):
         """Convert datetime fields for Elasticsearch storage (as ISO strings)"""
         from datetime import datetime
         
-        fields_meta = MetadataService.fields(entity)
-        data_copy = data.copy()
+        data_copy = data  # copied on first conversion only
         
-        for field, field_meta in fields_meta.items():
-            if field in data_copy and field_meta.get('type') == 'DateTime':
-                value = data_copy[field]
-                if isinstance(value, datetime):
-                    # Convert datetime to ISO string for ES storage
-                    data_copy[field] = value.isoformat()
+        for field in self._get_datetime_fields(entity):
+            value = data.get(field)
+            if isinstance(value, datetime):
+                # Convert datetime to ISO string for ES storage
+                if data_copy is data:
+                    data_copy = data.copy()
+                data_copy[field] = value.isoformat()
         
         return data_copy
     
+    @staticmethod
+    def _is_datetime_field(field_meta: Dict[str, Any]) -> bool:
+        return field_meta.get('type') == 'DateTime'
+
     def _convert_filter_values(self, filters: Dict[str, Any], entity: str) -> Dict[str, Any]:
         """Convert filter values to Elasticsearch-appropriate types"""
         if not filters:
@@ -330,9 +772,9 @@ class ElasticsearchDocuments(DocumentManager):
         es = self.database.core.get_connection()
         index = entity.lower()
 
-        if not await es.indices.exists(index=index):
-            return True  # No existing docs to check against
-
+        # One existence probe per constraint, sent together in a single _msearch
+        searches: List[Dict[str, Any]] = []
+        probed: List[List[str]] = []
         for constraint_fields in unique_constraints:
             # Build query to check for existing documents with same field values
             must_clauses = []
@@ -351,12 +793,30 @@ class ElasticsearchDocuments(DocumentManager):
             if exclude_id:
                 query["bool"]["must_not"] = [{"term": {"_id": exclude_id}}]
 
-            response = await es.search(
-                index=index,
-                body={"query": query, "size": 1}
-            )
+            # Existence probe only: stop collecting after the first match per shard and
+            # return no hits, just a count capped at 1. With size 0 the result is eligible
+            # for the shard request cache, so repeated probes for the same values are served
+            # from it until the next refresh changes the index.
+            # A missing index has no existing docs to check against - empty result, not an error
+            searches.append({"index": index, "ignore_unavailable": True, "request_cache": True})
+            searches.append({
+                "query": query,
+                "size": 0,
+                "terminate_after": 1,
+                "track_total_hits": 1
+            })
+            probed.append(constraint_fields)
+
+        if not probed:
+            return True
+
+        response = await es.msearch(searches=searches)
+
+        for constraint_fields, result in zip(probed, response.get("responses", [])):
+            if "error" in result:
+                raise DatabaseError(f"Unique constraint check failed for {entity}: {result['error']}")
 
-            if response.get("hits", {}).get("total", {}).get("value", 0) > 0:
+            if result.get("hits", {}).get("total", {}).get("value", 0) > 0:
                 # Use first field in constraint (matches MongoDB pattern)
                 duplicate_field = constraint_fields[0]
 
@@ -74,10 +74,10 @@ class DatabaseFactory:
             cls._instance = db
             cls._db_type = db_type
             
-            logging.info(f"DatabaseFactory: Initialized {db_type} database")
+            logging.info("DatabaseFactory: Initialized %s database", db_type)
             
         except Exception as e:
-            logging.error(f"Failed to initialize database: {str(e)}")
+            logging.error("Failed to initialize database: %s", e)
             raise
 
         return db
@@ -100,7 +100,7 @@ class DatabaseFactory:
         """
         cls._instance = instance
         cls._db_type = db_type
-        logging.info(f"Database instance set to: {db_type}")
+        logging.info("Database instance set to: %s", db_type)
 
     @classmethod
     def get_db_type(cls) -> Optional[str]:
@@ -24,13 +24,13 @@ class IndexManager(ABC):
                 for existing in existing_indexes:
                     if existing not in needed_uniques:
                         await self.delete(entity, existing)
-                        self.logger.info(f"Deleted obsolete index on {entity}: {existing}")
+                        self.logger.info("Deleted obsolete index on %s: %s", entity, existing)
                 for needed in needed_uniques:
                     if needed not in existing_indexes:
                         await self.create(entity, needed, unique=True)
-                        self.logger.info(f"Created missing index on {entity}: {needed}")
+                        self.logger.info("Created missing index on %s: %s", entity, needed)
         except Exception as e:
-            self.logger.error(f"Failed to initialize indexes: {str(e)}")
+            self.logger.error("Failed to initialize indexes: %s", e)
             return False
         return True
 
@@ -43,9 +43,9 @@ class IndexManager(ABC):
                 existing_indexes = await self.get_all(entity)
                 for existing in existing_indexes:
                     await self.delete(entity, existing)
-                    self.logger.info(f"Deleted index on {entity}: {existing}")
+                    self.logger.info("Deleted index on %s: %s", entity, existing)
         except Exception as e:
-            self.logger.error(f"Failed to reset indexes: {str(e)}")
+            self.logger.error("Failed to reset indexes: %s", e)
             return False
         return True
     
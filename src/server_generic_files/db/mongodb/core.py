@@ -21,9 +21,8 @@ class MongoCore(CoreManager):
         self._client: Optional[AsyncIOMotorClient] = None
         self._db: Optional[AsyncIOMotorDatabase] = None
     
-    @property
-    def id_field(self) -> str:
-        return "_id"
+    # Plain class attribute rather than a property: read once per document on result paths
+    id_field = "_id"
     
     async def init(self, connection_str: str, database_name: str) -> None:
         """Initialize MongoDB connection"""
@@ -37,7 +36,7 @@ class MongoCore(CoreManager):
         # Test connection
         await self._client.admin.command('ping')
         self.database._initialized = True
-        logging.info(f"MongoDatabase: Connected to {database_name}")
+        logging.info("MongoDatabase: Connected to %s", database_name)
     
     async def close(self) -> None:
         """Close MongoDB connection"""
@@ -50,18 +49,8 @@ class MongoCore(CoreManager):
     
     def get_id(self, document: Dict[str, Any]) -> Optional[str]:
         """Extract and normalize ID from MongoDB document"""
-        if not document:
-            return None
-            
-        id_value = document.get(self.id_field)
-        if id_value is None:
-            return None
-            
-        # Convert ObjectId to string
-        from bson import ObjectId
-        if isinstance(id_value, ObjectId):
-            return str(id_value)
-        
+        # str() covers ObjectId and plain string ids alike - no type check needed
+        id_value = document.get(self.id_field) if document else None
         return str(id_value) if id_value else None
     
     def get_connection(self) -> AsyncIOMotorDatabase:
@@ -91,7 +80,7 @@ class MongoCore(CoreManager):
                 return True
 
             except Exception as e:
-                logging.error(f"MongoDB wipe and reinit failed: {e}")
+                logging.error("MongoDB wipe and reinit failed: %s", e)
         return False
 
     async def get_status_report(self) -> dict:
@@ -4,6 +4,7 @@ Simple static notification system with 3 types: errors, request_warnings, warnin
 
 import logging
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Dict, List, Optional, Any
 from fastapi import HTTPException
 
@@ -51,7 +52,8 @@ class Notification:
     _errors: List[str] = []
     _warnings: Dict[str, Dict[str, List[Dict[str, str]]]] = {}  # Already in final format
     _request_warnings: List[Dict[str, str]] = []
-    _suppress_warnings: bool = False
+    # Per-task, so concurrent lookups (asyncio.gather) can't unsuppress each other
+    _suppress_warnings: ContextVar[bool] = ContextVar('suppress_warnings', default=False)
     
     @classmethod
     def start(cls) -> None:
@@ -64,12 +66,11 @@ class Notification:
     @contextmanager
     def suppress_warnings(cls):
         """Context manager to suppress warning notifications during FK lookups"""
-        old_value = cls._suppress_warnings
-        cls._suppress_warnings = True
+        token = cls._suppress_warnings.set(True)
         try:
             yield
         finally:
-            cls._suppress_warnings = old_value
+            cls._suppress_warnings.reset(token)
     
     @classmethod
     def get(cls) -> Dict[str, Any]:
@@ -116,7 +117,7 @@ class Notification:
         """
         category = get_error_category(status_code)
         cls._errors.append(f"[{category}] {message}")
-        logging.error(f"[{status_code}] {message}")
+        logging.error("[%s] %s", status_code, message)
 
         if raise_exception:
             raise StopWorkError(message, status_code, category, entity=entity, field=field, value=value)
@@ -129,7 +130,7 @@ class Notification:
     def warning(cls, warning_type: str, message: str = '', entity:str = '', entity_id:str = '', field:str = '', value = None, parameter:str = '') -> None:
         """Add warning"""
         # Skip warnings if suppressed (e.g., during FK lookups)
-        if cls._suppress_warnings:
+        if cls._suppress_warnings.get():
             return
             
         warning = {'type': warning_type}
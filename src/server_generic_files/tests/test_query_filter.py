@@ -0,0 +1,57 @@
+"""
+Tests for how Elasticsearch list filters are turned into query clauses.
+Run from the generated server directory (where this package is importable as app).
+"""
+import pytest
+
+pytest.importorskip("elasticsearch")
+
+from app.db.elasticsearch.documents import ElasticsearchDocuments
+from app.db.elasticsearch.core import SUBSTRING_GRAM
+from app.services.metadata import MetadataService
+
+
+USER_FIELDS = {
+    "username": {"type": "String"},
+    "gender": {"type": "String", "enum": {"values": ["male", "female", "other"]}},
+    "accountId": {"type": "ObjectId"},
+}
+
+
+@pytest.fixture
+def docs(monkeypatch):
+    monkeypatch.setattr(MetadataService, "_metadata", {"User": {"fields": USER_FIELDS}})
+    return ElasticsearchDocuments(database=None)
+
+
+def clauses(query):
+    return query["bool"]["filter"]
+
+
+def test_substring_uses_ngram_subfield(docs):
+    query = docs._build_query_filter({"username": "Smith"}, "User", frozenset({"username"}))
+
+    assert clauses(query) == [{"match_phrase": {"username.ngram": "Smith"}}]
+
+
+def test_short_value_falls_back_to_wildcard(docs):
+    value = "Ab"
+    assert len(value) < SUBSTRING_GRAM
+    query = docs._build_query_filter({"username": value}, "User", frozenset({"username"}))
+
+    assert clauses(query) == [{"wildcard": {"username": f"*{value.lower()}*"}}]
+
+
+def test_field_without_ngram_subfield_falls_back_to_wildcard(docs):
+    # Index created before the ngram subfield existed: no field reported by the mapping
+    query = docs._build_query_filter({"username": "Smith"}, "User", frozenset())
+
+    assert clauses(query) == [{"wildcard": {"username": "*smith*"}}]
+
+
+@pytest.mark.parametrize("field, value", [("gender", "female"), ("accountId", "a1b2c3d4")])
+def test_enum_and_fk_fields_use_term(docs, field, value):
+    # Even if the mapping reported an ngram subfield, exact-match fields never use it
+    query = docs._build_query_filter({field: value}, "User", frozenset({field}))
+
+    assert clauses(query) == [{"term": {field: value}}]
@@ -0,0 +1,89 @@
+"""
+Tests for the Elasticsearch write buffer's batching and result delivery.
+Run from the generated server directory (where this package is importable as app).
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("elasticsearch")
+
+from app.db.elasticsearch import documents
+from app.exceptions import DatabaseError
+
+
+class FakeClient:
+    """Records every bulk request and answers with one item per action unless told otherwise"""
+
+    def __init__(self, drop_items: int = 0, error: Exception = None):
+        self.batches = []
+        self.drop_items = drop_items
+        self.error = error
+
+    async def bulk(self, operations, refresh):
+        self.batches.append(len(operations) // 2)
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        items = [{"index": {"_id": op["index"]["_id"], "status": 201}} for op in operations[::2]]
+        return {"items": items[:len(items) - self.drop_items]}
+
+
+def header(i: int):
+    return {"index": {"_index": "test", "_id": str(i)}}
+
+
+def test_batches_never_exceed_chunk_size(monkeypatch):
+    monkeypatch.setattr(documents, "BULK_CHUNK_SIZE", 3)
+    client = FakeClient()
+
+    async def run():
+        buffer = documents._WriteBuffer(lambda: client, delay=0.01)
+        return await asyncio.gather(*(buffer.submit(header(i), {"n": i}, False) for i in range(10)))
+
+    results = asyncio.run(run())
+
+    assert [r["_id"] for r in results] == [str(i) for i in range(10)]
+    assert sum(client.batches) == 10
+    assert max(client.batches) <= 3
+
+
+def test_batches_never_exceed_byte_limit(monkeypatch):
+    doc = {"text": "x" * 100}
+    size = documents._action_size(header(0), doc)
+    monkeypatch.setattr(documents, "BULK_MAX_CHUNK_BYTES", size * 2)
+    client = FakeClient()
+
+    async def run():
+        buffer = documents._WriteBuffer(lambda: client, delay=0.01)
+        await asyncio.gather(*(buffer.submit(header(i), doc, False) for i in range(5)))
+
+    asyncio.run(run())
+
+    assert sum(client.batches) == 5
+    assert max(client.batches) <= 2
+
+
+def test_short_response_fails_unmatched_writes():
+    client = FakeClient(drop_items=1)
+
+    async def run():
+        buffer = documents._WriteBuffer(lambda: client, delay=0.01)
+        return await asyncio.gather(*(buffer.submit(header(i), {}, False) for i in range(3)), return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert [r["_id"] for r in results[:2]] == ["0", "1"]
+    assert isinstance(results[2], DatabaseError)
+
+
+def test_bulk_exception_reaches_every_writer():
+    client = FakeClient(error=ConnectionError("down"))
+
+    async def run():
+        buffer = documents._WriteBuffer(lambda: client, delay=0.01)
+        return await asyncio.gather(*(buffer.submit(header(i), {}, False) for i in range(3)), return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, ConnectionError) for r in results)
@@ -134,9 +134,9 @@ def generate_mmd(config_path: str):
     # Get indices
     collections = config.get("collections", [])
     if not collections:
+        # _cat/indices with only the name column; system (dot) indices excluded server-side
         collections = [
-            idx for idx in client.indices.get_alias().keys()
-            if not idx.startswith(".")  # Exclude system indices
+            row["index"] for row in client.cat.indices(index="*,-.*", h="index", format="json")
         ]
     
     logger.info(f"Found {len(collections)} collections in database")
@@ -147,13 +147,13 @@ def generate_mmd(config_path: str):
     field_to_collections: Dict[str, Set[str]] = defaultdict(set)
     field_global_types: Dict[str, Set[str]] = defaultdict(set)
 
+    # Get the mappings of all indices in one request rather than one per index
+    mappings = client.indices.get_mapping(index=",".join(collections), ignore_unavailable=True) if collections else {}
+
     # Collect metadata for each index
     for coll_name in collections:
-        # Get mapping
-        mapping = client.indices.get_mapping(index=coll_name)
-        
         # Fetch sample documents
-        search_body = {"size": SAMPLE_SIZE}
+        search_body = {"size": SAMPLE_SIZE, "track_total_hits": False}
         search_results = client.search(index=coll_name, body=search_body)
         docs = search_results['hits']['hits']
         
@@ -184,7 +184,7 @@ def generate_mmd(config_path: str):
         collection_indexes = []
         # Note: Elasticsearch index retrieval differs from MongoDB
         collection_indexes.append({
-            "fields": list(mapping[coll_name]['mappings']['properties'].keys()),
+            "fields": list(mappings.get(coll_name, {}).get('mappings', {}).get('properties', {}).keys()),
             "unique": False,  # Elasticsearch handles uniqueness differently
             "name": coll_name
         })
@@ -4,6 +4,9 @@ from utilities.utils import load_system_config
 from elasticsearch import Elasticsearch
 from common import Schema
 
+# Mapping shared by every unique-index field; the client serializes it per request
+KEYWORD_MAPPING = {"type": "keyword"}
+
 def update_indexes(schema_file, config_file):
     """
     Update Elasticsearch indexes following the same rules as MongoDB:
@@ -70,9 +73,7 @@ def update_indexes(schema_file, config_file):
                         index=index_name,
                         body={
                             "mappings": {
-                                "properties": {
-                                    field: {"type": "keyword"} for field in fields_tuple
-                                }
+                                "properties": dict.fromkeys(fields_tuple, KEYWORD_MAPPING)
                             }
                         }
                     )